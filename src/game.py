@@ -1,8 +1,11 @@
 import random
 from enum import Enum
-from typing import List, Dict
+from typing import List, Dict, Optional
 
+import icm
+import outs
 import player
+import stats
 
 MIN_BET = 10
 SMALL_BLIND = 10
@@ -28,9 +31,16 @@ class Game():
         self.community_cards: List[Game.Card] = []
 
         self.game_stage: GameStage = GameStage.PREFLOP
+        self.stage: GameStage = GameStage.PREFLOP
         self.betting_round_complite: bool = False
         self.is_game_going: bool = True
 
+        # Optional streaming statistics, fed with events of every hand
+        self.stats: Optional[stats.StatsAggregator] = None
+
+        # Hand classes and outs of every player, updated as the board is dealt
+        self.draw_tracker: outs.DrawTracker = outs.DrawTracker(self.deck)
+
     class Card:
         def __init__(self, rank:str, suit: str):
             self.rank = rank
@@ -73,8 +83,18 @@ class Game():
 
         for player in self.players:
             player.set_hand(self.deck.deal(2))
+        self.draw_tracker.start(self.players)
 
         self.dealer_position = (self.dealer_position + 1) % len(self.players)
+        for seat, player in enumerate(self.players):
+            player.set_position(stats.seat_position(seat, self.dealer_position, len(self.players)))
+
+        if self.stats is not None:
+            self.stats.start_hand(
+                    {seat: p.position for seat, p in enumerate(self.players)},
+                    {seat: p.stack for seat, p in enumerate(self.players)}
+                )
+
         self._post_blinds()
 
         self.active_players = [player for player in self.players if player.is_active]
@@ -100,6 +120,9 @@ class Game():
 
             self._handle_showdown(player.Player())
 
+            if self.stats is not None:
+                self.stats.end_hand({seat: p.stack for seat, p in enumerate(self.players)})
+
             if self._check_game_over():
                 self.is_game_going = False
 
@@ -137,10 +160,14 @@ class Game():
         if current_index < len(stage_order) - 1:
             self.stage = stage_order[current_index + 1]
 
+            cards = []
             if self.stage == GameStage.FLOP:
-                self.community_cards.extend(self.deck.deal(3))
+                cards = self.deck.deal(3)
             elif self.stage in [GameStage.TURN, GameStage.RIVER]:
-                self.community_cards.extend(self.deck.deal(1))
+                cards = self.deck.deal(1)
+
+            self.community_cards.extend(cards)
+            self.draw_tracker.add_community(cards)
 
     def _handle_showdown(self, current_player: player.Player) -> None:
         active_players = [p for p in self.players if p.is_active]
@@ -151,6 +178,12 @@ class Game():
             winner = self._determine_winner(active_players)
             winner.stack += self.pot
 
+            if self.stats is not None:
+                self.stats.on_showdown(
+                        [self.players.index(p) for p in active_players],
+                        self.players.index(winner)
+                    )
+
     def _handle_call(self, current_player: player.Player) -> None:
         call_amount = self.current_bet - current_player.current_bet
         current_player.stack -= call_amount
@@ -170,6 +203,9 @@ class Game():
         return sum(1 for p in self.players if p.stack > 0) <= 1
 
     def _process_decision(self, current_player: player.Player, decision: str):
+        if self.stats is not None:
+            self.stats.on_action(self.players.index(current_player), self.stage.value, decision)
+
         if decision == 'fold':
             current_player.is_active = False
         elif decision == 'call':
@@ -181,6 +217,14 @@ class Game():
     def _determine_winner(self, players: List[player.Player]) -> player.Player:
         return random.choice(players)
 
+    """Tournament equity of every player from current stacks, see icm.icm_equity"""
+    def get_icm_equity(self, payouts: List[int], method: str = "auto") -> List[float]:
+        return icm.icm_equity([p.stack for p in self.players], payouts, method)
+
+    """Hand class, outs and chance to improve on the next card for every active player"""
+    def get_draws(self) -> List[Dict]:
+        return self.draw_tracker.get_draws([p for p in self.players if p.is_active])
+
     # for GUI
     """Return game statistic"""
     def get_game_stat(self) -> Dict:
@@ -188,6 +232,8 @@ class Game():
                 'community_cards': self.community_cards,
                 'pot': self.pot,
                 'current_bet': self.current_bet,
+                'stage': self.stage.value,
+                'dealer_position': self.dealer_position,
                 'players': [
                     {
                         'hand': p.hand,
@@ -0,0 +1,174 @@
+from enum import IntEnum
+from typing import List, Dict
+
+"""
+Incremental hand class and outs tracking. Every player keeps rank/suit
+counters and rank bitmasks of hole + community cards, updated card by card
+as the board is dealt. Outs are found by trying every card left in the deck
+in place (add, classify, remove), without building new decks or hands.
+"""
+
+BOARD_SIZE = 5
+
+RANKS = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
+SUITS = ['♥', '♦', '♣', '♠']
+RANK_INDEX = {rank: i for i, rank in enumerate(RANKS)}
+SUIT_INDEX = {suit: i for i, suit in enumerate(SUITS)}
+
+ACE = RANK_INDEX['A']
+
+
+class HandClass(IntEnum):
+    HIGH_CARD = 0
+    PAIR = 1
+    TWO_PAIR = 2
+    THREE_OF_A_KIND = 3
+    STRAIGHT = 4
+    FLUSH = 5
+    FULL_HOUSE = 6
+    FOUR_OF_A_KIND = 7
+    STRAIGHT_FLUSH = 8
+
+
+def _has_straight(mask: int) -> bool:
+    # Ace also plays as the lowest card (A-2-3-4-5)
+    m = (mask << 1) | ((mask >> ACE) & 1)
+    return (m & (m >> 1) & (m >> 2) & (m >> 3) & (m >> 4)) != 0
+
+
+class PartialHand():
+    def __init__(self):
+        self.rank_counts: List[int] = [0] * len(RANKS)
+        self.suit_counts: List[int] = [0] * len(SUITS)
+        self.rank_mask: int = 0
+        self.suit_masks: List[int] = [0] * len(SUITS)
+        self.multiples: List[int] = [0] * 5 # how many ranks are held exactly 0..4 times
+
+        self.multiples[0] = len(RANKS)
+
+    def add(self, card) -> None:
+        rank, suit = RANK_INDEX[card.rank], SUIT_INDEX[card.suit]
+        count = self.rank_counts[rank]
+        self.multiples[count] -= 1
+        self.multiples[count + 1] += 1
+        self.rank_counts[rank] = count + 1
+        self.suit_counts[suit] += 1
+        self.rank_mask |= 1 << rank
+        self.suit_masks[suit] |= 1 << rank
+
+    def remove(self, card) -> None:
+        rank, suit = RANK_INDEX[card.rank], SUIT_INDEX[card.suit]
+        count = self.rank_counts[rank]
+        self.multiples[count] -= 1
+        self.multiples[count - 1] += 1
+        self.rank_counts[rank] = count - 1
+        self.suit_counts[suit] -= 1
+        if count == 1:
+            self.rank_mask &= ~(1 << rank)
+        self.suit_masks[suit] &= ~(1 << rank)
+
+    def classify(self) -> HandClass:
+        flush = False
+        for suit, count in enumerate(self.suit_counts):
+            if count >= 5:
+                if _has_straight(self.suit_masks[suit]):
+                    return HandClass.STRAIGHT_FLUSH
+                flush = True
+
+        multiples = self.multiples
+        if multiples[4]:
+            return HandClass.FOUR_OF_A_KIND
+        if multiples[3] and multiples[3] + multiples[2] >= 2:
+            return HandClass.FULL_HOUSE
+        if flush:
+            return HandClass.FLUSH
+        if _has_straight(self.rank_mask):
+            return HandClass.STRAIGHT
+        if multiples[3]:
+            return HandClass.THREE_OF_A_KIND
+        if multiples[2] >= 2:
+            return HandClass.TWO_PAIR
+        if multiples[2]:
+            return HandClass.PAIR
+        return HandClass.HIGH_CARD
+
+
+class DrawTracker():
+    """
+    Keeps a PartialHand per player for the current hand.
+    `start` is called once hole cards are dealt, `add_community` with every new board card.
+    """
+    def __init__(self, deck):
+        self.deck = deck
+        self.hands: Dict[int, PartialHand] = {}
+        self.classes: Dict[int, HandClass] = {}
+        self.board: PartialHand = PartialHand()
+        self.board_size: int = 0
+
+    def start(self, players: List) -> None:
+        self.hands.clear()
+        self.classes.clear()
+        self.board = PartialHand()
+        self.board_size = 0
+        for p in players:
+            hand = PartialHand()
+            for card in p.hand:
+                hand.add(card)
+            self.hands[id(p)] = hand
+            self.classes[id(p)] = hand.classify()
+
+    def add_community(self, cards: List) -> None:
+        for card in cards:
+            self.board.add(card)
+        self.board_size += len(cards)
+
+        for key, hand in self.hands.items():
+            for card in cards:
+                hand.add(card)
+            self.classes[key] = hand.classify()
+
+    def hand_class(self, player) -> HandClass:
+        return self.classes[id(player)]
+
+    """
+    Cards left in the deck that, dealt next, raise the player's hand class
+    above both the current one and what the board alone would make, so
+    cards that only improve the board (e.g. pair it) are not outs.
+    Only the turn and the river come one card at a time, so there are
+    outs only on the flop and the turn: none preflop (the flop deals three
+    cards) and none once the river is dealt.
+    """
+    def outs(self, player) -> List:
+        if self.board_size == 0 or self.board_size >= BOARD_SIZE:
+            return []
+
+        hand = self.hands[id(player)]
+        board = self.board
+        current = self.classes[id(player)]
+        outs = []
+        for card in self.deck.cards:
+            hand.add(card)
+            new_class = hand.classify()
+            if new_class > current:
+                board.add(card)
+                if new_class > board.classify():
+                    outs.append(card)
+                board.remove(card)
+            hand.remove(card)
+        return outs
+
+    """Players not dealt into the current hand (or before the first one) are skipped"""
+    def get_draws(self, players: List) -> List[Dict]:
+        draws = []
+        for p in players:
+            if id(p) not in self.hands:
+                continue
+            outs = self.outs(p)
+            remaining = len(self.deck.cards)
+            draws.append({
+                    'player': p,
+                    'hand_class': self.classes[id(p)],
+                    'outs': outs,
+                    'improve_probability': len(outs) / remaining if remaining else 0.0
+                })
+        return draws
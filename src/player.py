@@ -46,8 +46,14 @@ class UserPlayer(Player):
 
 
 class BotPlayer(Player):
-    def __init__(self, hand=None):
+    def __init__(self, hand=None, policy=None):
         super().__init__(hand)
+        self.policy = policy # anything with get_action(bot) -> str, e.g. trainer.StrategyPolicy
+
+    def get_decision(self) -> str:
+        if self.policy is None:
+            return super().get_decision()
+        return self.policy.get_action(self)
 
     def get_hand(self) -> list:
         return super().get_hand() if self.is_hand_known else ["Unknown",""]
@@ -0,0 +1,117 @@
+import multiprocessing as mp
+import os
+from typing import List, Dict, Optional, Tuple, Iterator
+
+"""
+Offscreen rendering of recorded hands. A recorded hand is a list of frames,
+each frame a `Game.get_game_stat()` dict (use `snapshot` to make it JSON
+friendly). Frames are drawn by `window.PokerGame` on an invisible surface
+under the SDL dummy video driver, no window and no frame rate limit.
+Every worker process keeps one renderer, so card sprites are drawn once
+per process and reused for all of its hands.
+
+Workers are started with "spawn", so they import pygame fresh with the
+dummy driver even if the calling process already opened a window. As with
+any spawn pool, the calling script needs an `if __name__ == "__main__":` guard.
+"""
+
+FRAME_SIZE = (1000, 700)
+
+_renderer = None
+
+
+def snapshot(game, current_player: Optional[int] = None) -> Dict:
+    """Game.get_game_stat() with cards as [rank, suit] pairs and the seat that is to act"""
+    stat = game.get_game_stat()
+    return {
+            'community_cards': [[c.rank, c.suit] for c in stat['community_cards']],
+            'pot': stat['pot'],
+            'current_bet': stat['current_bet'],
+            'stage': stat['stage'],
+            'dealer_position': stat['dealer_position'],
+            'current_player': current_player,
+            'players': [
+                {
+                    'hand': [[c.rank, c.suit] for c in p['hand']],
+                    'stack': p['stack'],
+                    'current_bet': p['current_bet'],
+                    'is_active': p['is_active']
+                } for p in stat['players']
+            ]
+        }
+
+
+def _init_worker(size: Tuple[int, int], show_hole_cards: bool) -> None:
+    # Must be set before pygame is initialized, i.e. before window is imported.
+    # SDL signal handlers would turn the pool's SIGTERM into a QUIT event nobody reads
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_NO_SIGNAL_HANDLERS"] = "1"
+    import pygame
+    import window
+
+    global _renderer
+    _renderer = window.PokerGame(screen=pygame.Surface(size))
+    _renderer.show_all_cards = show_hole_cards
+
+
+def _render_frames(frames: List[Dict]) -> Iterator:
+    # The same surface is redrawn for every frame, so use it before taking the next one.
+    # Animation restarts with every hand, so a hand looks the same whichever worker draws it
+    _renderer.reset_animation()
+    for frame in frames:
+        _renderer.load_game_stat(frame)
+        _renderer.render()
+        yield _renderer.screen
+
+
+def _render_hand(job: Tuple[int, List[Dict], Optional[str], str]):
+    import pygame
+
+    index, frames, out_dir, fmt = job
+    if out_dir is None:
+        return [pygame.image.tobytes(surface, "RGB") for surface in _render_frames(frames)]
+
+    if fmt == "raw":
+        path = os.path.join(out_dir, f"hand_{index:06d}.rgb")
+        with open(path, "wb") as f:
+            for surface in _render_frames(frames):
+                f.write(pygame.image.tobytes(surface, "RGB"))
+        return [path]
+
+    hand_dir = os.path.join(out_dir, f"hand_{index:06d}")
+    os.makedirs(hand_dir, exist_ok=True)
+    paths = []
+    for i, surface in enumerate(_render_frames(frames)):
+        path = os.path.join(hand_dir, f"frame_{i:04d}.{fmt}")
+        pygame.image.save(surface, path)
+        paths.append(path)
+    return paths
+
+
+def render_hands(hands: List[List[Dict]], out_dir: Optional[str] = None, fmt: str = "png",
+                 size: Tuple[int, int] = FRAME_SIZE, processes: Optional[int] = None,
+                 show_hole_cards: bool = True) -> Iterator[List]:
+    """
+    Render every hand on a pool of processes, yielding one result per hand in input order.
+    With `out_dir` frames are written as images (`fmt` - png, jpg, bmp...) into one directory per hand,
+    or with fmt="raw" as one file of concatenated RGB frame buffers per hand; file paths are yielded.
+    Without `out_dir` raw RGB frame buffers (`size[0] * size[1] * 3` bytes each) are yielded,
+    so only the hands being rendered or consumed are held in memory.
+    Hole cards of all players are drawn face up unless `show_hole_cards` is False.
+    """
+    if out_dir is not None:
+        os.makedirs(out_dir, exist_ok=True)
+
+    jobs = ((i, frames, out_dir, fmt) for i, frames in enumerate(hands))
+    pool = mp.get_context("spawn").Pool(processes, initializer=_init_worker, initargs=(size, show_hole_cards))
+    finished = False
+    try:
+        yield from pool.imap(_render_hand, jobs)
+        finished = True
+    finally:
+        # Stopped early (consumer broke out or failed): drop the remaining hands
+        if finished:
+            pool.close()
+        else:
+            pool.terminate()
+        pool.join()
@@ -0,0 +1,222 @@
+import json
+import os
+from typing import List, Dict, Optional
+
+"""Positions as described in README"""
+POSITIONS = ["UTG", "MP", "BTN", "SB", "BB"]
+UTG, MP, BTN, SB, BB = range(len(POSITIONS))
+
+PREFLOP = "pre-flop"
+
+CHECKPOINT_VERSION = 1
+
+
+"""
+Maps seat index to README position, counted from the dealer button.
+Follows Game._post_blinds: heads-up the dealer posts the big blind.
+"""
+def seat_position(seat: int, dealer_position: int, num_players: int) -> int:
+    offset = (seat - dealer_position) % num_players
+    if num_players == 2:
+        return BB if offset == 0 else SB
+    if offset == 0:
+        return BTN
+    if offset == 1:
+        return SB
+    if offset == 2:
+        return BB
+    return UTG if offset == 3 else MP
+
+
+class PlayerStats():
+    def __init__(self):
+        self.hands: int = 0
+        self.vpip_hands: int = 0
+        self.pfr_hands: int = 0
+        self.aggressive_actions: int = 0
+        self.calls: int = 0
+        self.showdowns: int = 0
+        self.showdowns_won: int = 0
+        self.net_by_position: List[int] = [0] * len(POSITIONS)
+        self.hands_by_position: List[int] = [0] * len(POSITIONS)
+
+    @property
+    def vpip(self) -> float:
+        return self.vpip_hands / self.hands if self.hands else 0.0
+
+    @property
+    def pfr(self) -> float:
+        return self.pfr_hands / self.hands if self.hands else 0.0
+
+    @property
+    def aggression_factor(self) -> float:
+        if self.calls == 0:
+            return float(self.aggressive_actions)
+        return self.aggressive_actions / self.calls
+
+    @property
+    def showdown_win_rate(self) -> float:
+        return self.showdowns_won / self.showdowns if self.showdowns else 0.0
+
+    @property
+    def net_winnings(self) -> int:
+        return sum(self.net_by_position)
+
+    def to_dict(self) -> Dict:
+        return dict(self.__dict__)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "PlayerStats":
+        stats = cls()
+        stats.__dict__.update(data)
+        return stats
+
+
+class StatsAggregator():
+    """
+    Streaming per-player statistics. Each event updates the counters in O(1),
+    per-hand flags (VPIP/PFR) are kept only for the hand in progress and
+    folded into the totals on `end_hand`, so history is never rescanned.
+    """
+    def __init__(self, checkpoint_path: Optional[str] = None):
+        self.players: Dict[str, PlayerStats] = {}
+        self.hands_processed: int = 0
+        self.checkpoint_path = checkpoint_path
+
+        # State of the hand in progress
+        self._positions: Dict[str, int] = {}
+        self._start_stacks: Dict[str, int] = {}
+        self._vpip: set = set()
+        self._pfr: set = set()
+        self._in_hand: bool = False
+
+        if checkpoint_path is not None and os.path.exists(checkpoint_path):
+            self.load(checkpoint_path)
+
+    def _get(self, player_id) -> PlayerStats:
+        key = str(player_id)
+        stats = self.players.get(key)
+        if stats is None:
+            stats = self.players[key] = PlayerStats()
+        return stats
+
+    def start_hand(self, positions: Dict, stacks: Dict) -> None:
+        self._positions = {str(k): v for k, v in positions.items()}
+        self._start_stacks = {str(k): v for k, v in stacks.items()}
+        self._vpip.clear()
+        self._pfr.clear()
+        self._in_hand = True
+
+    def on_action(self, player_id, stage: str, decision: str) -> None:
+        if not self._in_hand:
+            return
+
+        key = str(player_id)
+        stats = self._get(key)
+
+        if decision == 'raise':
+            stats.aggressive_actions += 1
+        elif decision == 'call':
+            stats.calls += 1
+
+        if stage == PREFLOP and decision in ('call', 'raise'):
+            self._vpip.add(key)
+            if decision == 'raise':
+                self._pfr.add(key)
+
+    def on_showdown(self, player_ids: List, winner_id) -> None:
+        if not self._in_hand:
+            return
+
+        for player_id in player_ids:
+            self._get(player_id).showdowns += 1
+        self._get(winner_id).showdowns_won += 1
+
+    def end_hand(self, stacks: Dict) -> None:
+        if not self._in_hand:
+            return
+
+        stacks = {str(k): v for k, v in stacks.items()}
+
+        for key, start_stack in self._start_stacks.items():
+            stats = self._get(key)
+            position = self._positions.get(key, -1)
+
+            stats.hands += 1
+            if key in self._vpip:
+                stats.vpip_hands += 1
+            if key in self._pfr:
+                stats.pfr_hands += 1
+
+            if 0 <= position < len(POSITIONS):
+                stats.hands_by_position[position] += 1
+                stats.net_by_position[position] += stacks.get(key, start_stack) - start_stack
+
+        self.hands_processed += 1
+        self._in_hand = False
+
+    def consume(self, event: Dict) -> None:
+        kind = event['type']
+        if kind == 'start':
+            self.start_hand(event['positions'], event['stacks'])
+        elif kind == 'action':
+            self.on_action(event['player'], event['stage'], event['decision'])
+        elif kind == 'showdown':
+            self.on_showdown(event['players'], event['winner'])
+        elif kind == 'end':
+            self.end_hand(event['stacks'])
+        else:
+            raise ValueError(f"Unknown event type: {kind}")
+
+    """
+    Stored hands are lists of events, given in the order they were played.
+    Hands already counted in a loaded checkpoint are skipped.
+    """
+    def consume_hands(self, hands: List[List[Dict]], first_hand_id: int = 0) -> None:
+        for hand_id, hand in enumerate(hands, first_hand_id):
+            if hand_id < self.hands_processed:
+                continue
+            for event in hand:
+                self.consume(event)
+
+    def get_player_stat(self, player_id) -> Dict:
+        # Unknown players are reported empty, but not added to the checkpoint
+        stats = self.players.get(str(player_id)) or PlayerStats()
+        return {
+                'hands': stats.hands,
+                'vpip': stats.vpip,
+                'pfr': stats.pfr,
+                'aggression_factor': stats.aggression_factor,
+                'showdown_win_rate': stats.showdown_win_rate,
+                'net_winnings': stats.net_winnings,
+                'net_by_position': dict(zip(POSITIONS, stats.net_by_position)),
+            }
+
+    # Checkpoints
+
+    def save(self, path: Optional[str] = None) -> None:
+        path = path or self.checkpoint_path
+        if path is None:
+            raise ValueError("No checkpoint path given")
+
+        data = {
+                'version': CHECKPOINT_VERSION,
+                'hands_processed': self.hands_processed,
+                'players': {k: v.to_dict() for k, v in self.players.items()},
+            }
+
+        # Write to a temporary file first, so a crash never leaves a broken checkpoint
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+    def load(self, path: str) -> None:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+
+        if data.get('version') != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version: {data.get('version')}")
+
+        self.hands_processed = data['hands_processed']
+        self.players = {k: PlayerStats.from_dict(v) for k, v in data['players'].items()}
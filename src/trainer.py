@@ -0,0 +1,287 @@
+import multiprocessing as mp
+import random
+import time
+from multiprocessing import shared_memory
+from typing import List, Dict, Optional, Callable
+
+import game
+import player
+import stats
+
+"""
+Self-play trainer for BotPlayer policies.
+
+Every worker process owns its own headless `Game` table of `BotPlayer`s and
+plays preflop hands with regret matching. Regret and strategy updates are
+accumulated locally and merged every `sync_every` iterations into a store
+in shared memory. The store is split into shards, each guarded by its own
+lock, so workers only contend when flushing into the same shard. Reads
+of the store are lock-free. Tables never leave their worker.
+
+The abstraction is deliberately small: one decision per player in seat
+order, information set = (position, preflop hand class). Payoffs come from
+`Game` itself (blinds, call/raise sizes and showdown), so the policy gets
+better together with the game rules.
+"""
+
+ACTIONS = ['fold', 'call', 'raise']
+NUM_ACTIONS = len(ACTIONS)
+
+RANKS = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
+RANK_INDEX = {rank: i for i, rank in enumerate(RANKS)}
+NUM_HAND_CLASSES = len(RANKS) * len(RANKS) # 13 pairs + 78 suited + 78 offsuit = 169
+NUM_INFO_SETS = len(stats.POSITIONS) * NUM_HAND_CLASSES
+
+STARTING_STACK = 1000
+
+
+"""13x13 grid (row * 13 + col): pairs on the diagonal, suited hands below it (row = high card), offsuit hands above it"""
+def hand_class(hand: List) -> int:
+    first, second = RANK_INDEX[hand[0].rank], RANK_INDEX[hand[1].rank]
+    high, low = max(first, second), min(first, second)
+    if hand[0].suit == hand[1].suit:
+        return high * len(RANKS) + low
+    return low * len(RANKS) + high
+
+
+def info_set(bot: player.Player) -> int:
+    return bot.position * NUM_HAND_CLASSES + hand_class(bot.hand)
+
+
+def regret_matching(regrets, offset: int) -> List[float]:
+    positive = [max(regrets[offset + a], 0.0) for a in range(NUM_ACTIONS)]
+    total = sum(positive)
+    if total <= 0:
+        return [1.0 / NUM_ACTIONS] * NUM_ACTIONS
+    return [r / total for r in positive]
+
+
+class StrategyStore():
+    """
+    Regret and strategy sums of all information sets in one shared memory block:
+    [regrets (NUM_INFO_SETS * NUM_ACTIONS) | strategy sums (NUM_INFO_SETS * NUM_ACTIONS)]
+    """
+    def __init__(self, num_shards: int = 16, name: Optional[str] = None, locks: Optional[List] = None):
+        size = 2 * NUM_INFO_SETS * NUM_ACTIONS * 8
+        self.is_owner = name is None
+        self.shm = shared_memory.SharedMemory(name=name, create=self.is_owner, size=size)
+        self.values = self.shm.buf.cast('d') # a fresh block is zero-filled
+
+        self.locks = locks if locks is not None else [mp.Lock() for _ in range(num_shards)]
+        self.num_shards = len(self.locks)
+        self.strategy_offset = NUM_INFO_SETS * NUM_ACTIONS
+
+    def shard(self, info_set: int) -> int:
+        return info_set % self.num_shards
+
+    def merge(self, regret_deltas: Dict[int, List[float]], strategy_deltas: Dict[int, List[float]]) -> None:
+        by_shard: Dict[int, List[int]] = {}
+        for key in regret_deltas.keys() | strategy_deltas.keys():
+            by_shard.setdefault(self.shard(key), []).append(key)
+
+        for shard, keys in by_shard.items():
+            with self.locks[shard]:
+                for key in keys:
+                    offset = key * NUM_ACTIONS
+                    for a, delta in enumerate(regret_deltas.get(key, ())):
+                        self.values[offset + a] += delta
+                    for a, delta in enumerate(strategy_deltas.get(key, ())):
+                        self.values[self.strategy_offset + offset + a] += delta
+
+    def average_strategy(self) -> List[List[float]]:
+        strategy = []
+        for key in range(NUM_INFO_SETS):
+            offset = self.strategy_offset + key * NUM_ACTIONS
+            sums = [self.values[offset + a] for a in range(NUM_ACTIONS)]
+            total = sum(sums)
+            strategy.append([s / total for s in sums] if total > 0 else [1.0 / NUM_ACTIONS] * NUM_ACTIONS)
+        return strategy
+
+    """Sum of average positive regrets, the usual CFR upper bound on exploitability (chips per hand)"""
+    def exploitability_bound(self, iterations: int) -> float:
+        if iterations == 0:
+            return float('inf')
+        total = 0.0
+        for key in range(NUM_INFO_SETS):
+            offset = key * NUM_ACTIONS
+            total += max(max(self.values[offset + a] for a in range(NUM_ACTIONS)), 0.0)
+        return total / iterations
+
+    def close(self) -> None:
+        self.values.release()
+        self.shm.close()
+        if self.is_owner:
+            self.shm.unlink()
+
+
+class StrategyPolicy():
+    """Plain average strategy, detached from shared memory, for BotPlayer.policy"""
+    def __init__(self, strategy: List[List[float]]):
+        self.strategy = strategy
+
+    def get_action(self, bot: player.Player) -> str:
+        return random.choices(ACTIONS, self.strategy[info_set(bot)])[0]
+
+
+class _Worker():
+    def __init__(self, store: StrategyStore, num_players: int, seed: int):
+        self.store = store
+        self.random = random.Random(seed)
+        self.table = game.Game([player.BotPlayer() for _ in range(num_players)])
+        self.regret_deltas: Dict[int, List[float]] = {}
+        self.strategy_deltas: Dict[int, List[float]] = {}
+
+    def _strategy(self, key: int) -> List[float]:
+        # Shared regrets plus the ones not yet flushed by this worker
+        local = self.regret_deltas.get(key)
+        if local is None:
+            return regret_matching(self.store.values, key * NUM_ACTIONS)
+        offset = key * NUM_ACTIONS
+        return regret_matching([self.store.values[offset + a] + local[a] for a in range(NUM_ACTIONS)], 0)
+
+    def _deal(self) -> None:
+        table = self.table
+        table.deck.reset()
+        self.random.shuffle(table.deck.cards)
+        table.dealer_position = (table.dealer_position + 1) % len(table.players)
+        for seat, bot in enumerate(table.players):
+            bot.set_hand(table.deck.deal(2))
+            bot.set_position(stats.seat_position(seat, table.dealer_position, len(table.players)))
+
+    def _play(self, decisions: List[str], showdown_seed: int) -> List[int]:
+        table = self.table
+        for bot in table.players:
+            bot.stack = STARTING_STACK
+            bot.current_bet = 0
+            bot.is_active = True
+        table.pot = 0
+        table.stage = game.GameStage.PREFLOP
+        table._post_blinds()
+
+        num_players = len(table.players)
+        first = (table.dealer_position + 3) % num_players
+        for i in range(num_players):
+            seat = (first + i) % num_players
+            if sum(1 for p in table.players if p.is_active) == 1:
+                break
+            table._process_decision(table.players[seat], decisions[seat])
+
+        # Same winner for every replay of this hand
+        state = random.getstate()
+        random.seed(showdown_seed)
+        table._handle_showdown(table.players[first])
+        random.setstate(state)
+
+        return [bot.stack - STARTING_STACK for bot in table.players]
+
+    def iteration(self) -> None:
+        self._deal()
+        table = self.table
+        num_players = len(table.players)
+
+        keys = [info_set(bot) for bot in table.players]
+        strategies = [self._strategy(key) for key in keys]
+        decisions = [self.random.choices(ACTIONS, s)[0] for s in strategies]
+
+        traverser = self.random.randrange(num_players)
+        showdown_seed = self.random.getrandbits(32)
+        utilities = []
+        for action in ACTIONS:
+            decisions[traverser] = action
+            utilities.append(self._play(decisions, showdown_seed)[traverser])
+
+        key = keys[traverser]
+        strategy = strategies[traverser]
+        expected = sum(p * u for p, u in zip(strategy, utilities))
+
+        regrets = self.regret_deltas.setdefault(key, [0.0] * NUM_ACTIONS)
+        sums = self.strategy_deltas.setdefault(key, [0.0] * NUM_ACTIONS)
+        for a in range(NUM_ACTIONS):
+            regrets[a] += utilities[a] - expected
+            sums[a] += strategy[a]
+
+    def flush(self) -> None:
+        self.store.merge(self.regret_deltas, self.strategy_deltas)
+        self.regret_deltas.clear()
+        self.strategy_deltas.clear()
+
+
+def _worker_main(store_name: str, locks: List, counter, stop_event,
+                 num_players: int, sync_every: int, seed: int) -> None:
+    store = StrategyStore(name=store_name, locks=locks)
+    worker = _Worker(store, num_players, seed)
+    try:
+        while not stop_event.is_set():
+            for _ in range(sync_every):
+                worker.iteration()
+            worker.flush()
+            with counter.get_lock():
+                counter.value += sync_every
+    finally:
+        store.close()
+
+
+"""Workers only stop on stop_event, so any non-zero exit code means a crash"""
+def _check_workers(workers: List[mp.Process]) -> None:
+    for w in workers:
+        if w.exitcode is not None and w.exitcode != 0:
+            raise RuntimeError(f"Self-play worker {w.name} died with exit code {w.exitcode}")
+
+
+class SelfPlayTrainer():
+    def __init__(self, num_players: int = 6, num_workers: Optional[int] = None,
+                 num_shards: int = 16, sync_every: int = 200):
+        self.num_players = num_players
+        self.num_workers = num_workers or mp.cpu_count()
+        self.sync_every = sync_every
+        self.store = StrategyStore(num_shards)
+        self.iterations: int = 0 # over all train() calls, the regrets in the store cover all of them
+
+    def train(self, seconds: float, report_interval: float = 1.0,
+              report: Optional[Callable[[int, float, float], None]] = None) -> int:
+        report = report or (lambda it, ips, expl: print(f"{it} iterations, {ips:.0f} it/s, exploitability <= {expl:.2f}"))
+
+        counter = mp.Value('q', self.iterations)
+        stop_event = mp.Event()
+        workers = [
+                mp.Process(
+                    target=_worker_main,
+                    args=(self.store.shm.name, self.store.locks, counter, stop_event,
+                          self.num_players, self.sync_every, random.getrandbits(32)),
+                    daemon=True
+                ) for _ in range(self.num_workers)
+            ]
+        for w in workers:
+            w.start()
+
+        start = last_time = time.perf_counter()
+        last_iterations = self.iterations
+        try:
+            while time.perf_counter() - start < seconds:
+                time.sleep(report_interval)
+                _check_workers(workers)
+                now = time.perf_counter()
+                iterations = counter.value
+                report(iterations, (iterations - last_iterations) / (now - last_time),
+                       self.store.exploitability_bound(iterations))
+                last_time, last_iterations = now, iterations
+        finally:
+            stop_event.set()
+            for w in workers:
+                w.join()
+            self.iterations = counter.value
+
+        _check_workers(workers)
+        return self.iterations
+
+    def get_policy(self) -> StrategyPolicy:
+        return StrategyPolicy(self.store.average_strategy())
+
+    def close(self) -> None:
+        self.store.close()
+
+
+if __name__ == "__main__":
+    trainer = SelfPlayTrainer()
+    trainer.train(seconds=10)
+    trainer.close()
@@ -6,7 +6,8 @@ blue - (169, 205, 229)
 import pygame
 import sys
 import math
-from typing import List, Tuple, Optional
+from collections import OrderedDict
+from typing import List, Tuple, Optional, Dict
 
 # Инициализация Pygame
 pygame.init()
@@ -40,6 +41,13 @@ BUTTON_HEIGHT_RATIO = 0.06
 BUTTON_MARGIN_RATIO = 0.02
 FONT_SIZE_RATIO = 0.025
 
+# Мульти-стол
+MULTI_TABLE_FPS = 30
+TILE_MARGIN = 4
+SPRITE_SHEET_CACHE_SIZE = 4 # сколько размеров карт держать в памяти одновременно
+SUITS = ['♥', '♦', '♣', '♠']
+RANKS = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
+
 class Card:
     """Класс для представления игральной карты"""
     def __init__(self, suit: str, rank: str):
@@ -51,16 +59,27 @@ class Card:
     
     def render(self, surface: pygame.Surface, x: int, y: int, 
                card_width: int, card_height: int, visible: bool = True):
-        """Отрисовка карты на поверхности"""
+        """Отрисовка карты на поверхности (копия из закешированного спрайт-листа)"""
+        sprites = get_sprite_sheet(card_width, card_height)
+        area = sprites.area(self) if visible else sprites.back_rect
+        surface.blit(sprites.sheet, (x, y), area)
+
+    def _draw(self, surface: pygame.Surface, x: int, y: int,
+              card_width: int, card_height: int, visible: bool = True):
+        """Непосредственное рисование карты, используется при создании спрайт-листа"""
         rect = pygame.Rect(x, y, card_width, card_height)
         corner_radius = max(5, card_width // 10)
+
+        # Маленькие карты (мульти-стол) не должны залезать на соседние ячейки листа
+        previous_clip = surface.get_clip()
+        surface.set_clip(rect)
         
         if visible:
             # Видимая карта
             pygame.draw.rect(surface, CARD_COLOR, rect, 0, corner_radius)
             pygame.draw.rect(surface, (0, 0, 0), rect, 2, corner_radius)
             
-            font = pygame.font.SysFont('Arial', max(16, card_width // 4))
+            font = pygame.font.SysFont('Arial', max(6, min(max(16, card_width // 4), card_height // 2)))
             text = font.render(str(self), True, (0, 0, 0))
             text_rect = text.get_rect(center=rect.center)
             surface.blit(text, text_rect)
@@ -82,6 +101,47 @@ class Card:
                               (x + 3*card_width//4, y + 2*card_height//3), 
                               pattern_radius)
 
+        surface.set_clip(previous_clip)
+
+
+class CardSpriteSheet:
+    """Спрайт-лист: все 52 карты и рубашка, отрисованные один раз для заданного размера"""
+    def __init__(self, card_width: int, card_height: int):
+        self.card_width = card_width
+        self.card_height = card_height
+        self.sheet = pygame.Surface((card_width * len(RANKS), card_height * (len(SUITS) + 1)), pygame.SRCALPHA)
+        self.rects: Dict[Tuple[str, str], pygame.Rect] = {}
+
+        for row, suit in enumerate(SUITS):
+            for col, rank in enumerate(RANKS):
+                x, y = col * card_width, row * card_height
+                Card(suit, rank)._draw(self.sheet, x, y, card_width, card_height, True)
+                self.rects[(rank, suit)] = pygame.Rect(x, y, card_width, card_height)
+
+        # Рубашка в последней строке
+        back_y = len(SUITS) * card_height
+        Card("", "")._draw(self.sheet, 0, back_y, card_width, card_height, False)
+        self.back_rect = pygame.Rect(0, back_y, card_width, card_height)
+
+    def area(self, card) -> pygame.Rect:
+        """Область карты на листе; всё, что не похоже на карту, рисуется рубашкой"""
+        return self.rects.get((getattr(card, 'rank', None), getattr(card, 'suit', None)), self.back_rect)
+
+
+_sprite_sheets: "OrderedDict[Tuple[int, int], CardSpriteSheet]" = OrderedDict()
+
+def get_sprite_sheet(card_width: int, card_height: int) -> CardSpriteSheet:
+    """Общий спрайт-лист для размера карт; старые размеры (например, после resize) вытесняются"""
+    key = (card_width, card_height)
+    sheet = _sprite_sheets.get(key)
+    if sheet is None:
+        sheet = _sprite_sheets[key] = CardSpriteSheet(card_width, card_height)
+        if len(_sprite_sheets) > SPRITE_SHEET_CACHE_SIZE:
+            _sprite_sheets.popitem(last=False)
+    else:
+        _sprite_sheets.move_to_end(key)
+    return sheet
+
 
 class Player:
     """Класс для представления игрока (человека или бота)"""
@@ -101,8 +161,9 @@ class Player:
         """Раздать карту игроку"""
         self.cards.append(card)
     
-    def render(self, surface: pygame.Surface, card_width: int, card_height: int, font: pygame.font.Font):
-        """Отрисовка игрока и его карт"""
+    def render(self, surface: pygame.Surface, card_width: int, card_height: int, font: pygame.font.Font,
+               show_cards: bool = False):
+        """Отрисовка игрока и его карт (show_cards - открыть карты и ботов, например для повторов)"""
         x, y = self.position
     
         # Цвет текста в зависимости от активности
@@ -131,7 +192,7 @@ class Player:
         for i, card in enumerate(self.cards):
             card_x = x - offset + i * card_width
             card_y = y
-            visible = self.is_human or self.folded
+            visible = self.is_human or self.folded or show_cards
             card.render(surface, card_x, card_y, card_width, card_height, visible)
         
         # Отображение имени игрока
@@ -210,18 +271,20 @@ class Button:
 
 class PokerGame:
     """Основной класс игры в покер"""
-    def __init__(self, num_players: int = 4):
-        # Создаем окно с поддержкой изменения размера
-        self.screen = pygame.display.set_mode(
-            (INIT_SCREEN_WIDTH, INIT_SCREEN_HEIGHT), 
-            pygame.RESIZABLE
-        )
-        pygame.display.set_caption("Poker Game")
+    def __init__(self, num_players: int = 4, screen: Optional[pygame.Surface] = None):
+        if screen is None:
+            # Создаем окно с поддержкой изменения размера
+            screen = pygame.display.set_mode(
+                (INIT_SCREEN_WIDTH, INIT_SCREEN_HEIGHT), 
+                pygame.RESIZABLE
+            )
+            pygame.display.set_caption("Poker Game")
+        # Иначе рисуем на переданной (например, невидимой) поверхности
+        self.screen = screen
         self.clock = pygame.time.Clock()
         
         # Текущие размеры экрана
-        self.screen_width = INIT_SCREEN_WIDTH
-        self.screen_height = INIT_SCREEN_HEIGHT
+        self.screen_width, self.screen_height = screen.get_size()
         
         # Рассчитываем размеры элементов
         self.calculate_sizes()
@@ -233,8 +296,6 @@ class PokerGame:
         # Создание игроков
         self.players: List[Player] = []
         self.create_players(num_players)
-        self.players[1].is_dealer = True
-        self.players[0].is_active = True
         
         # Создание кнопок
         self.buttons = self.create_buttons()
@@ -257,6 +318,11 @@ class PokerGame:
         # Статистика игры
         self.pot = 500
         self.current_bet = 100
+        self.stage_name = "Turn"
+        self.active_name: Optional[str] = "You"
+
+        # Показывать карты всех игроков (повторы раздач)
+        self.show_all_cards = False
         
     def calculate_sizes(self):
         """Пересчет размеров элементов в зависимости от размера окна"""
@@ -277,8 +343,10 @@ class PokerGame:
         for i in range(1, num_players):
             self.players.append(Player(f"Bot {i}"))
         
-        # Назначаем дилера
-        self.players[1].is_dealer = True
+        # Назначаем дилера (если за столом есть кто-то кроме человека)
+        if len(self.players) > 1:
+            self.players[1].is_dealer = True
+        self.players[0].is_active = True
         
     def create_buttons(self) -> List[Button]:
         """Создание интерфейсных кнопок"""
@@ -365,6 +433,45 @@ class PokerGame:
                 for card in test_cards[i]:
                     player.deal_card(card)
     
+    def load_game_stat(self, stat: Dict):
+        """Загрузка состояния из Game.get_game_stat() (карты - объекты с rank/suit или пары [rank, suit])"""
+        def to_card(card) -> Card:
+            if hasattr(card, 'rank'):
+                return Card(card.suit, card.rank)
+            return Card(card[1], card[0])
+
+        if len(stat['players']) != len(self.players):
+            self.players = []
+            self.create_players(len(stat['players']))
+            self.arrange_players()
+
+        # Необязательные поля: дилер, стадия и игрок, который сейчас ходит
+        dealer = stat.get('dealer_position')
+        current = stat.get('current_player')
+
+        for seat, (player, data) in enumerate(zip(self.players, stat['players'])):
+            player.cards = [to_card(card) for card in data['hand']]
+            player.stack = data['stack']
+            player.current_bet = data['current_bet']
+            player.folded = not data['is_active']
+            if dealer is not None:
+                player.is_dealer = seat == dealer
+            if 'current_player' in stat:
+                player.is_active = seat == current
+
+        self.community_cards = [to_card(card) for card in stat['community_cards']]
+        self.pot = stat['pot']
+        self.current_bet = stat['current_bet']
+        if 'stage' in stat:
+            self.stage_name = stat['stage'].capitalize()
+        if 'current_player' in stat:
+            self.active_name = self.players[current].name if current is not None else None
+
+    def reset_animation(self):
+        """Сброс анимации (пульсации рамки), чтобы одинаковое состояние рисовалось одинаково"""
+        for player in self.players:
+            player.border_pulse = 0
+
     def arrange_players(self):
         """Расположение игроков вокруг стола"""
         center_x = self.screen_width // 2
@@ -427,12 +534,13 @@ class PokerGame:
         self.screen.blit(bet_text, (20, 50))
         
         # Стадия игры
-        stage_text = self.font.render("Stage: Turn", True, PLAYER_TEXT_COLOR)
+        stage_text = self.font.render(f"Stage: {self.stage_name}", True, PLAYER_TEXT_COLOR)
         self.screen.blit(stage_text, (20, 80))
         
-        # Активный игрок
-        active_text = self.font.render("Active: You", True, PLAYER_TEXT_COLOR)
-        self.screen.blit(active_text, (20, 110))
+        # Активный игрок (если известен)
+        if self.active_name is not None:
+            active_text = self.font.render(f"Active: {self.active_name}", True, PLAYER_TEXT_COLOR)
+            self.screen.blit(active_text, (20, 110))
     
     def handle_events(self):
         """Обработка событий игры"""
@@ -475,7 +583,7 @@ class PokerGame:
         
         # Рисуем игроков и их карты
         for player in self.players:
-            player.render(self.screen, self.card_width, self.card_height, self.font)
+            player.render(self.screen, self.card_width, self.card_height, self.font, self.show_all_cards)
         
         # Рисуем кнопки
         for button in self.buttons:
@@ -493,6 +601,158 @@ class PokerGame:
             pygame.display.flip()
             self.clock.tick(60)
 
+class TableView:
+    """Один стол в мульти-режиме: своя подповерхность, перерисовка только при изменении игры"""
+    def __init__(self, game, surface: pygame.Surface, rect: pygame.Rect, font: pygame.font.Font):
+        self.game = game
+        self.surface = surface
+        self.rect = rect
+        self.font = font
+        self.last_state = None
+
+        width, height = surface.get_size()
+        min_dimension = min(width, height)
+        self.center = (width // 2, height // 2)
+        self.table_radius = int(min_dimension * TABLE_RADIUS_RATIO)
+        self.card_width = max(8, int(min_dimension * CARD_WIDTH_RATIO))
+        self.card_height = max(12, int(min_dimension * CARD_HEIGHT_RATIO))
+        self.sprites = get_sprite_sheet(self.card_width, self.card_height)
+
+    def _hand(self, player) -> list:
+        # get_hand() сам прячет карты ботов, если рука не открыта
+        hand = player.get_hand()
+        return hand if player.hand else []
+
+    def _state(self) -> tuple:
+        """Снимок всего, что видно на столе; по нему определяется, нужна ли перерисовка"""
+        game = self.game
+        return (
+            tuple((c.rank, c.suit) for c in game.community_cards),
+            game.pot,
+            game.current_bet,
+            tuple(
+                (tuple((getattr(c, 'rank', c), getattr(c, 'suit', '')) for c in self._hand(p)),
+                 p.stack, p.current_bet, p.is_active)
+                for p in game.players
+            )
+        )
+
+    def update(self) -> bool:
+        """Перерисовать стол, если состояние игры изменилось. Возвращает True, если была отрисовка"""
+        state = self._state()
+        if state == self.last_state:
+            return False
+        self.last_state = state
+        self.draw()
+        return True
+
+    def draw(self):
+        """Отрисовка стола: карты выводятся одним пакетным blits из общего спрайт-листа"""
+        surface = self.surface
+        surface.fill(BACKGROUND_COLOR)
+        pygame.draw.circle(surface, TABLE_COLOR, self.center, self.table_radius)
+
+        sheet = self.sprites.sheet
+        blits = []
+
+        # Общие карты
+        community = self.game.community_cards
+        start_x = self.center[0] - len(community) * self.card_width // 2
+        y = self.center[1] - self.card_height // 2
+        for i, card in enumerate(community):
+            blits.append((sheet, (start_x + i * self.card_width, y), self.sprites.area(card)))
+
+        # Игроки по кругу
+        players = self.game.players
+        player_offset = self.table_radius * 1.1
+        texts = []
+        angle_step = 360 / len(players) if players else 0
+        for i, player in enumerate(players):
+            angle_rad = math.radians(90 + i * angle_step)
+            x = int(self.center[0] + player_offset * math.cos(angle_rad))
+            y = int(self.center[1] + player_offset * math.sin(angle_rad)) - self.card_height // 2
+
+            for j, card in enumerate(self._hand(player)):
+                blits.append((sheet, (x - self.card_width + j * self.card_width, y), self.sprites.area(card)))
+
+            text_color = PLAYER_TEXT_COLOR if player.is_active else PLAYER_INACTIVE_COLOR
+            stack_text = self.font.render(f"${player.stack}", True, text_color)
+            texts.append((stack_text, stack_text.get_rect(center=(x, y + self.card_height + self.font.get_height() // 2))))
+
+        pot_text = self.font.render(f"Pot: ${self.game.pot}", True, PLAYER_TEXT_COLOR)
+        texts.append((pot_text, (2, 2)))
+
+        surface.blits(blits, False)
+        surface.blits(texts, False)
+
+
+class MultiTableWindow:
+    """Окно с сеткой из N столов (объекты game.Game) для наблюдения за многими играми сразу"""
+    def __init__(self, games: List, columns: Optional[int] = None):
+        self.games = games
+        # Пустой список столов - одна пустая плитка, без деления на ноль
+        self.columns = columns or max(1, math.ceil(math.sqrt(len(games))))
+        self.rows = max(1, math.ceil(len(games) / self.columns))
+
+        self.screen = pygame.display.set_mode(
+            (INIT_SCREEN_WIDTH, INIT_SCREEN_HEIGHT),
+            pygame.RESIZABLE
+        )
+        pygame.display.set_caption(f"Poker Tables ({len(games)})")
+        self.clock = pygame.time.Clock()
+        self.create_views()
+
+    def create_views(self):
+        """Разбиение окна на плитки; каждая плитка - подповерхность экрана"""
+        screen_width, screen_height = self.screen.get_size()
+        tile_width = screen_width // self.columns
+        tile_height = screen_height // self.rows
+        font_size = max(10, int(min(tile_width, tile_height) * FONT_SIZE_RATIO * 2))
+        self.font = pygame.font.SysFont('Arial', font_size)
+
+        self.screen.fill(BACKGROUND_COLOR)
+        self.views: List[TableView] = []
+        for i, game in enumerate(self.games):
+            row, col = divmod(i, self.columns)
+            rect = pygame.Rect(
+                col * tile_width + TILE_MARGIN // 2,
+                row * tile_height + TILE_MARGIN // 2,
+                tile_width - TILE_MARGIN,
+                tile_height - TILE_MARGIN
+            )
+            self.views.append(TableView(game, self.screen.subsurface(rect), rect, self.font))
+
+    def handle_events(self):
+        """Обработка событий окна"""
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+
+            elif event.type == pygame.VIDEORESIZE:
+                width = max(MIN_WIDTH, event.w)
+                height = max(MIN_HEIGHT, event.h)
+                self.screen = pygame.display.set_mode((width, height), pygame.RESIZABLE)
+                self.create_views()
+                pygame.display.flip()
+
+    def render(self) -> List[pygame.Rect]:
+        """Перерисовка изменившихся столов, возвращает их области на экране"""
+        return [view.rect for view in self.views if view.update()]
+
+    def run(self, step=None):
+        """Основной цикл; step() вызывается каждый кадр, чтобы продвигать игры"""
+        while True:
+            self.handle_events()
+            if step is not None:
+                step()
+
+            dirty_rects = self.render()
+            if dirty_rects:
+                pygame.display.update(dirty_rects)
+            self.clock.tick(MULTI_TABLE_FPS)
+
+
 if __name__ == "__main__":
     num_players = 6
     
@@ -0,0 +1,52 @@
+import itertools
+
+import pytest
+
+import icm
+
+
+def _brute_force(stacks, payouts):
+    equity = [0.0] * len(stacks)
+    for order in itertools.permutations(range(len(stacks))):
+        probability = 1.0
+        remaining = sum(stacks)
+        for i in order:
+            probability *= stacks[i] / remaining
+            remaining -= stacks[i]
+        for place, i in enumerate(order[:len(payouts)]):
+            equity[i] += probability * payouts[place]
+    return equity
+
+
+@pytest.mark.parametrize("stacks, payouts", [
+    ([100, 200, 300, 50, 400], [5, 3, 1]),
+    ([1000, 2000, 3000, 4000, 1500, 2500, 800], [50, 30, 20, 10, 5, 4, 3]),
+    ([10, 10, 10], [1, 0, 0]),
+])
+def test_exact_matches_brute_force(stacks, payouts):
+    assert icm.icm_equity(stacks, payouts, method="exact") == pytest.approx(_brute_force(stacks, payouts), abs=1e-12)
+
+
+def test_busted_players_get_nothing():
+    equity = icm.icm_equity([0, 100, 300], [10, 5, 1])
+    assert equity[0] == 0.0
+    assert equity[1:] == pytest.approx(_brute_force([100, 300], [10, 5]))
+
+
+def test_monte_carlo_close_to_exact():
+    stacks = [100, 200, 300, 50, 400, 250]
+    payouts = [50, 30, 20]
+    estimate = icm.icm_equity(stacks, payouts, method="monte_carlo", samples=50000, seed=1)
+    assert estimate == pytest.approx(icm.icm_equity(stacks, payouts, method="exact"), abs=0.5)
+
+
+def test_batch_matches_single():
+    payouts = [5, 3, 1]
+    distributions = [[100, 200, 300], [300, 200, 100], [100, 200, 300]]
+    results = icm.icm_equity_batch(distributions, payouts)
+    assert results == [icm.icm_equity(d, payouts) for d in distributions]
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        icm.icm_equity([1, 2], [1], method="guess")
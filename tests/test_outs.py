@@ -0,0 +1,110 @@
+import pytest
+
+import game
+import outs
+import player
+from outs import HandClass
+
+
+def _cards(text: str) -> list:
+    # "A♥ 10♦" -> [Card("A", "♥"), Card("10", "♦")]
+    return [game.Game.Card(card[:-1], card[-1]) for card in text.split()]
+
+
+def _classify(text: str) -> HandClass:
+    hand = outs.PartialHand()
+    for card in _cards(text):
+        hand.add(card)
+    return hand.classify()
+
+
+@pytest.mark.parametrize("cards, expected", [
+    ("A♥ K♦ 7♣ 4♠ 2♥", HandClass.HIGH_CARD),
+    ("A♥ A♦ 7♣ 4♠ 2♥", HandClass.PAIR),
+    ("A♥ A♦ 7♣ 7♠ 2♥", HandClass.TWO_PAIR),
+    ("A♥ A♦ A♣ 7♠ 2♥", HandClass.THREE_OF_A_KIND),
+    ("A♥ 2♦ 3♣ 4♠ 5♥", HandClass.STRAIGHT),
+    ("10♥ J♦ Q♣ K♠ A♥", HandClass.STRAIGHT),
+    ("K♥ A♦ 2♣ 3♠ 4♥", HandClass.HIGH_CARD), # no wrap-around
+    ("2♥ 7♥ 9♥ J♥ K♥", HandClass.FLUSH),
+    ("A♥ A♦ A♣ 7♠ 7♥", HandClass.FULL_HOUSE),
+    ("A♥ A♦ A♣ 7♠ 7♥ 7♦ 2♣", HandClass.FULL_HOUSE), # two trips
+    ("A♥ A♦ A♣ A♠ 7♥", HandClass.FOUR_OF_A_KIND),
+    ("A♠ 2♠ 3♠ 4♠ 5♠", HandClass.STRAIGHT_FLUSH),
+    ("9♠ 10♠ J♠ Q♠ K♠ 2♥ 3♥", HandClass.STRAIGHT_FLUSH),
+    ("A♠ 2♠ 3♠ 4♠ 5♥ 9♠", HandClass.FLUSH), # straight and flush, but not in one suit
+])
+def test_classify(cards, expected):
+    assert _classify(cards) == expected
+
+
+def test_has_straight_wheel():
+    ranks = [outs.RANK_INDEX[r] for r in ['A', '2', '3', '4', '5']]
+    assert outs._has_straight(sum(1 << r for r in ranks))
+    assert not outs._has_straight(sum(1 << r for r in ranks[:4]))
+
+
+def test_remove_restores_state():
+    hand = outs.PartialHand()
+    for card in _cards("A♥ K♥ 7♣ 7♠ 2♥"):
+        hand.add(card)
+    before = (list(hand.rank_counts), list(hand.suit_counts), hand.rank_mask, list(hand.suit_masks), list(hand.multiples))
+
+    for card in _cards("7♦ 3♥ A♣"):
+        hand.add(card)
+        hand.remove(card)
+
+    assert before == (list(hand.rank_counts), list(hand.suit_counts), hand.rank_mask, list(hand.suit_masks), list(hand.multiples))
+
+
+def _tracker(hole: str, board: str):
+    deck = game.Game.Deck()
+    p = player.BotPlayer(_cards(hole))
+    dealt = {(c.rank, c.suit) for c in _cards(hole + " " + board)}
+    deck.cards = [c for c in deck.cards if (c.rank, c.suit) not in dealt]
+
+    tracker = outs.DrawTracker(deck)
+    tracker.start([p])
+    tracker.add_community(_cards(board))
+    return tracker, p
+
+
+def test_flush_draw_outs():
+    tracker, p = _tracker("A♥ 8♥", "K♥ 7♥ 2♣")
+    flush_outs = [c for c in tracker.outs(p) if c.suit == '♥']
+    assert len(flush_outs) == 9
+    assert tracker.hand_class(p) == HandClass.HIGH_CARD
+
+
+def test_board_only_improvement_is_not_an_out():
+    tracker, p = _tracker("A♥ 8♦", "K♣ 7♠ 2♣")
+    out_ranks = {c.rank for c in tracker.outs(p)}
+    # Pairing a hole card counts, pairing the board does not
+    assert out_ranks == {'A', '8'}
+
+
+def test_no_outs_after_river():
+    tracker, p = _tracker("A♥ 8♥", "K♥ 7♥ 2♣ 3♦ 9♠")
+    assert tracker.outs(p) == []
+    assert tracker.get_draws([p])[0]['improve_probability'] == 0.0
+
+
+def test_game_draws_skip_folded_players():
+    table = game.Game([player.UserPlayer()] + [player.BotPlayer() for _ in range(3)])
+    table.start_new_hangout()
+    table._advance_stage()
+
+    table.players[1].is_active = False
+    draws = table.get_draws()
+    assert [d['player'] for d in draws] == [table.players[0]] + table.players[2:]
+
+
+def test_game_draws_before_first_hand():
+    table = game.Game([player.UserPlayer(), player.BotPlayer()])
+    assert table.get_draws() == []
+
+
+def test_no_single_card_outs_preflop():
+    table = game.Game([player.UserPlayer(), player.BotPlayer()])
+    table.start_new_hangout()
+    assert all(d['outs'] == [] and d['improve_probability'] == 0.0 for d in table.get_draws())
@@ -0,0 +1,69 @@
+import os
+
+import pytest
+
+import game
+import player
+import replay
+
+SIZE = (320, 240)
+
+
+@pytest.fixture(scope="module")
+def hand():
+    table = game.Game([player.UserPlayer()] + [player.BotPlayer() for _ in range(3)])
+    table.start_new_hangout()
+    frames = [replay.snapshot(table, current_player=0)]
+    table._advance_stage()
+    frames.append(replay.snapshot(table, current_player=1))
+    return frames
+
+
+def test_snapshot_records_stage_and_dealer(hand):
+    assert hand[0]['stage'] == game.GameStage.PREFLOP.value
+    assert hand[1]['stage'] == game.GameStage.FLOP.value
+    assert hand[0]['dealer_position'] == 1
+    assert len(hand[1]['community_cards']) == 3
+
+
+def test_raw_buffers_are_deterministic(hand):
+    # Both hands go to the same worker, so leftover animation state would show up here
+    first, second = replay.render_hands([hand, hand], size=SIZE, processes=1)
+
+    assert len(first) == len(hand)
+    assert all(len(buffer) == SIZE[0] * SIZE[1] * 3 for buffer in first)
+    assert first == second
+    assert first[0] != first[1]
+
+
+def test_png_layout(hand, tmp_path):
+    results = list(replay.render_hands([hand], out_dir=str(tmp_path), size=SIZE, processes=1))
+
+    hand_dir = tmp_path / "hand_000000"
+    assert results == [[str(hand_dir / "frame_0000.png"), str(hand_dir / "frame_0001.png")]]
+    assert sorted(os.listdir(hand_dir)) == ["frame_0000.png", "frame_0001.png"]
+
+
+def test_raw_file_layout(hand, tmp_path):
+    results = list(replay.render_hands([hand], out_dir=str(tmp_path), fmt="raw", size=SIZE, processes=1))
+
+    path = tmp_path / "hand_000000.rgb"
+    assert results == [[str(path)]]
+    assert os.listdir(tmp_path) == ["hand_000000.rgb"]
+    assert path.stat().st_size == len(hand) * SIZE[0] * SIZE[1] * 3
+
+
+def test_animation_restarts_per_hand(hand):
+    # The pulsing border is hidden under the cards, so check the renderer state directly
+    replay._init_worker(SIZE, True)
+    list(replay._render_frames(hand))
+    pulses = [p.border_pulse for p in replay._renderer.players]
+    list(replay._render_frames(hand))
+    assert [p.border_pulse for p in replay._renderer.players] == pulses
+    assert any(pulses)
+
+
+def test_hole_cards_face_up(hand):
+    shown, = replay.render_hands([hand[:1]], size=SIZE, processes=1)
+    hidden, = replay.render_hands([hand[:1]], size=SIZE, processes=1, show_hole_cards=False)
+    assert shown != hidden
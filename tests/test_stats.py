@@ -0,0 +1,99 @@
+import game
+import player
+import stats
+
+
+def _hand(raiser_wins: bool = True):
+    # Seat 0 raises preflop, seat 1 calls, seat 2 folds; 0 and 1 go to showdown
+    winner = 0 if raiser_wins else 1
+    return [
+        {'type': 'start', 'positions': {0: stats.UTG, 1: stats.BTN, 2: stats.BB}, 'stacks': {0: 1000, 1: 1000, 2: 1000}},
+        {'type': 'action', 'player': 0, 'stage': 'pre-flop', 'decision': 'raise'},
+        {'type': 'action', 'player': 1, 'stage': 'pre-flop', 'decision': 'call'},
+        {'type': 'action', 'player': 2, 'stage': 'pre-flop', 'decision': 'fold'},
+        {'type': 'action', 'player': 0, 'stage': 'flop', 'decision': 'raise'},
+        {'type': 'action', 'player': 1, 'stage': 'flop', 'decision': 'call'},
+        {'type': 'showdown', 'players': [0, 1], 'winner': winner},
+        {'type': 'end', 'stacks': {0: 1100 if raiser_wins else 900, 1: 900 if raiser_wins else 1100, 2: 1000}},
+    ]
+
+
+def test_counts_from_events():
+    aggregator = stats.StatsAggregator()
+    aggregator.consume_hands([_hand(), _hand(raiser_wins=False)])
+
+    raiser = aggregator.get_player_stat(0)
+    assert raiser['hands'] == 2
+    assert raiser['vpip'] == 1.0
+    assert raiser['pfr'] == 1.0
+    assert raiser['aggression_factor'] == 4.0 # 4 raises, no calls
+    assert raiser['showdown_win_rate'] == 0.5
+    assert raiser['net_winnings'] == 0
+
+    caller = aggregator.get_player_stat(1)
+    assert caller['vpip'] == 1.0
+    assert caller['pfr'] == 0.0
+    assert caller['aggression_factor'] == 0.0
+
+    folder = aggregator.get_player_stat(2)
+    assert folder['hands'] == 2
+    assert folder['vpip'] == 0.0
+
+
+def test_net_winnings_by_position():
+    aggregator = stats.StatsAggregator()
+    aggregator.consume_hands([_hand()])
+
+    assert aggregator.get_player_stat(0)['net_by_position']['UTG'] == 100
+    assert aggregator.get_player_stat(1)['net_by_position']['BTN'] == -100
+
+
+def test_seat_position():
+    positions = [stats.seat_position(seat, 0, 5) for seat in range(5)]
+    assert positions == [stats.BTN, stats.SB, stats.BB, stats.UTG, stats.MP]
+
+
+def test_seat_position_heads_up():
+    # Game._post_blinds makes the dealer post the big blind heads-up
+    assert [stats.seat_position(seat, 0, 2) for seat in range(2)] == [stats.BB, stats.SB]
+    assert [stats.seat_position(seat, 1, 2) for seat in range(2)] == [stats.SB, stats.BB]
+
+
+def test_heads_up_game_positions_match_blinds():
+    table = game.Game([player.UserPlayer(), player.BotPlayer()])
+    table.start_new_hangout()
+
+    for p in table.players:
+        expected = -game.BIG_BLIND if p.position == stats.BB else -game.SMALL_BLIND
+        assert p.stack == expected
+
+
+def test_unknown_player_is_not_stored():
+    aggregator = stats.StatsAggregator()
+    assert aggregator.get_player_stat("nobody")['hands'] == 0
+    assert "nobody" not in aggregator.players
+
+
+def test_events_outside_hand_are_ignored():
+    aggregator = stats.StatsAggregator()
+    aggregator.on_action(0, 'pre-flop', 'raise')
+    aggregator.on_showdown([0, 1], 0)
+    assert aggregator.players == {}
+
+
+def test_resume_skips_counted_hands(tmp_path):
+    path = str(tmp_path / "stats.json")
+    hands = [_hand(), _hand(), _hand(raiser_wins=False)]
+
+    aggregator = stats.StatsAggregator(path)
+    aggregator.consume_hands(hands[:2])
+    aggregator.save()
+
+    resumed = stats.StatsAggregator(path)
+    assert resumed.hands_processed == 2
+    resumed.consume_hands(hands)
+
+    raiser = resumed.get_player_stat(0)
+    assert raiser['hands'] == 3
+    assert raiser['showdown_win_rate'] == 2 / 3
+    assert raiser['net_winnings'] == 100
@@ -0,0 +1,67 @@
+import itertools
+
+import pytest
+
+import game
+import trainer
+
+
+def _hand(first: str, second: str):
+    return [game.Game.Card(first[:-1], first[-1]), game.Game.Card(second[:-1], second[-1])]
+
+
+def test_hand_class_is_unique():
+    classes = {}
+    for high, low in itertools.combinations_with_replacement(reversed(trainer.RANKS), 2):
+        hands = [(_hand(high + '♥', low + '♠'), 'offsuit' if high != low else 'pair')]
+        if high != low:
+            hands.append((_hand(high + '♥', low + '♥'), 'suited'))
+        for hand, kind in hands:
+            key = trainer.hand_class(hand)
+            assert key not in classes
+            classes[key] = (high, low, kind)
+
+    assert len(classes) == 169
+    assert all(0 <= key < trainer.NUM_HAND_CLASSES for key in classes)
+
+
+def test_hand_class_ignores_card_order():
+    assert trainer.hand_class(_hand('A♥', 'K♥')) == trainer.hand_class(_hand('K♥', 'A♥'))
+    assert trainer.hand_class(_hand('A♥', 'K♠')) == trainer.hand_class(_hand('K♦', 'A♣'))
+    # Suited AK: row 12 (A), col 11 (K)
+    assert trainer.hand_class(_hand('A♥', 'K♥')) == 12 * 13 + 11
+
+
+def test_regret_matching():
+    assert trainer.regret_matching([3.0, 1.0, -5.0], 0) == [0.75, 0.25, 0.0]
+    assert trainer.regret_matching([9.0, -1.0, 0.0, -2.0], 1) == [1 / 3] * 3
+
+
+@pytest.fixture
+def store():
+    store = trainer.StrategyStore(num_shards=4)
+    yield store
+    store.close()
+
+
+def test_merge_accumulates_into_offsets(store):
+    store.merge({1: [1.0, 2.0, 3.0], 5: [-1.0, 0.0, 1.0]}, {1: [0.5, 0.5, 0.0]})
+    store.merge({5: [2.0, 2.0, 2.0], 6: [4.0, 0.0, 0.0]}, {5: [0.0, 0.0, 1.0]})
+
+    n = trainer.NUM_ACTIONS
+    assert store.shard(1) == store.shard(5) != store.shard(6)
+    assert list(store.values[1 * n:2 * n]) == [1.0, 2.0, 3.0]
+    assert list(store.values[5 * n:6 * n]) == [1.0, 2.0, 3.0]
+    assert list(store.values[6 * n:7 * n]) == [4.0, 0.0, 0.0]
+    assert list(store.values[0:n]) == [0.0, 0.0, 0.0]
+
+    strategy = store.average_strategy()
+    assert strategy[1] == [0.5, 0.5, 0.0]
+    assert strategy[5] == [0.0, 0.0, 1.0]
+    assert strategy[0] == [1 / 3] * 3
+
+
+def test_exploitability_bound(store):
+    assert store.exploitability_bound(0) == float('inf')
+    store.merge({0: [4.0, -1.0, 0.0], 2: [-3.0, -1.0, -2.0]}, {})
+    assert store.exploitability_bound(2) == 2.0
@@ -0,0 +1,77 @@
+import os
+
+# pygame is initialized when window is imported, so the driver must be set first
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+
+import pygame
+import pytest
+
+import game
+import player
+import window
+
+
+def _table(num_players: int = 3) -> game.Game:
+    table = game.Game([player.UserPlayer()] + [player.BotPlayer() for _ in range(num_players - 1)])
+    table.start_new_hangout()
+    return table
+
+
+def _view(table: game.Game) -> window.TableView:
+    surface = pygame.Surface((240, 180))
+    return window.TableView(table, surface, surface.get_rect(), pygame.font.SysFont('Arial', 10))
+
+
+def test_update_only_on_change():
+    table = _table()
+    view = _view(table)
+    assert view.update()
+    assert not view.update()
+
+    table.pot += 10
+    assert view.update()
+    assert not view.update()
+
+    table._advance_stage()
+    assert view.update()
+
+    table.players[1].is_active = False
+    assert view.update()
+    assert not view.update()
+
+
+def test_update_without_players():
+    view = _view(game.Game([]))
+    assert view.update()
+
+
+def test_multi_table_window_without_games():
+    tables = window.MultiTableWindow([])
+    assert tables.render() == []
+
+
+def test_hidden_bot_hand_uses_back():
+    sprites = window.get_sprite_sheet(20, 30)
+    bot = player.BotPlayer([game.Game.Card('A', '♥'), game.Game.Card('K', '♥')])
+
+    hidden = bot.get_hand()
+    assert hidden == ["Unknown", ""]
+    assert all(sprites.area(card) == sprites.back_rect for card in hidden)
+
+    bot.open_hand()
+    assert all(sprites.area(card) != sprites.back_rect for card in bot.get_hand())
+
+
+def test_sprite_sheet_lru():
+    window._sprite_sheets.clear()
+    sizes = [(10 + i, 20 + i) for i in range(window.SPRITE_SHEET_CACHE_SIZE + 1)]
+    sheets = [window.get_sprite_sheet(*size) for size in sizes]
+
+    assert len(window._sprite_sheets) == window.SPRITE_SHEET_CACHE_SIZE
+    assert sizes[0] not in window._sprite_sheets
+
+    # A hit refreshes the entry, so the next miss evicts the oldest other size
+    assert window.get_sprite_sheet(*sizes[1]) is sheets[1]
+    window.get_sprite_sheet(50, 60)
+    assert sizes[1] in window._sprite_sheets
+    assert sizes[2] not in window._sprite_sheets